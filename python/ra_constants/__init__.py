@@ -5,74 +5,13 @@ Ra Constants - Universal mathematical constants for harmonic resonance systems.
 MIT License
 """
 
-from .frequencies import (
-    A432,
-    A440,
-    SCHUMANN_2ND,
-    SCHUMANN_3RD,
-    SCHUMANN_4TH,
-    SCHUMANN_5TH,
-    SCHUMANN_FUNDAMENTAL,
-    SCHUMANN_HARMONICS,
-    SOLFEGGIO_FA,
-    SOLFEGGIO_FREQUENCIES,
-    SOLFEGGIO_LA,
-    SOLFEGGIO_MI,
-    SOLFEGGIO_RE,
-    SOLFEGGIO_SOL,
-    SOLFEGGIO_UT,
-    MaterialFrequency,
-)
-from .phi import (
-    # Core constants
-    PHI,
-    PHI_INVERSE,
-    PHI_SQUARED,
-    PI,
-    SQRT_2,
-    SQRT_3,
-    SQRT_5,
-    TAU,
-    E,
-    # Ra System named constants
-    GREEN_PHI,
-    ANKH,
-    RA,
-    SCARAB,
-    PHI_NEG1,
-    PHI_NEG2,
-    PHI_NEG3,
-    PHI_NEG4,
-    # Five φ bands
-    PhiBand,
-    PhiBandInfo,
-    PHI_BANDS,
-    PHI_PERIODS,
-    PHI_OMEGA,
-    PHI_WEIGHTS,
-    PHI_BAND_ULTRA,
-    PHI_BAND_SLOW,
-    PHI_BAND_CORE,
-    PHI_BAND_FAST,
-    PHI_BAND_RAPID,
-    # Functions
-    phi_power,
-    fibonacci_ratio,
-    is_phi_ratio,
-    band_frequency_range,
-    frequency_to_band,
-    compute_multiwave_coherence,
-)
-from .thresholds import (
-    HIGH_COHERENCE,
-    LOW_COHERENCE,
-    MEDIUM_COHERENCE,
-    MINIMUM_COHERENCE,
-    CoherenceLevel,
-)
+from __future__ import annotations
+
+from importlib import import_module
+from typing import Any
 
 __version__ = "0.2.0"
-__all__ = [
+__all__ = (
     # Mathematical core
     "PHI",
     "PHI_INVERSE",
@@ -111,7 +50,9 @@ __all__ = [
     "is_phi_ratio",
     "band_frequency_range",
     "frequency_to_band",
+    "frequency_to_band_batch",
     "compute_multiwave_coherence",
+    "compute_multiwave_coherence_batch",
     # Frequencies
     "SCHUMANN_FUNDAMENTAL",
     "SCHUMANN_2ND",
@@ -129,10 +70,67 @@ __all__ = [
     "SOLFEGGIO_LA",
     "SOLFEGGIO_FREQUENCIES",
     "MaterialFrequency",
+    "harmonic_series",
+    "octave_series",
     # Thresholds
     "HIGH_COHERENCE",
     "MEDIUM_COHERENCE",
     "LOW_COHERENCE",
     "MINIMUM_COHERENCE",
     "CoherenceLevel",
-]
+)
+
+# Submodule holding each public name. Symbols resolve lazily (PEP 562),
+# so `import ra_constants` skips enum and NamedTuple class construction
+# until a name from that submodule is actually touched.
+_SUBMODULE_BY_NAME = {}
+for _submodule, _names in (
+    ("phi", (
+        "PHI", "PHI_INVERSE", "PHI_SQUARED", "SQRT_2", "SQRT_3", "SQRT_5",
+        "PI", "TAU", "E",
+        "GREEN_PHI", "ANKH", "RA", "SCARAB",
+        "PHI_NEG1", "PHI_NEG2", "PHI_NEG3", "PHI_NEG4",
+        "PhiBand", "PhiBandInfo",
+        "PHI_BAND_ULTRA", "PHI_BAND_SLOW", "PHI_BAND_CORE",
+        "PHI_BAND_FAST", "PHI_BAND_RAPID",
+        "PHI_BANDS", "PHI_PERIODS", "PHI_OMEGA", "PHI_WEIGHTS",
+        "phi_power", "fibonacci_ratio", "is_phi_ratio",
+        "band_frequency_range", "frequency_to_band", "frequency_to_band_batch",
+        "compute_multiwave_coherence", "compute_multiwave_coherence_batch",
+    )),
+    ("frequencies", (
+        "SCHUMANN_FUNDAMENTAL", "SCHUMANN_2ND", "SCHUMANN_3RD",
+        "SCHUMANN_4TH", "SCHUMANN_5TH", "SCHUMANN_HARMONICS",
+        "A432", "A440",
+        "SOLFEGGIO_UT", "SOLFEGGIO_RE", "SOLFEGGIO_MI", "SOLFEGGIO_FA",
+        "SOLFEGGIO_SOL", "SOLFEGGIO_LA", "SOLFEGGIO_FREQUENCIES",
+        "MaterialFrequency", "harmonic_series", "octave_series",
+    )),
+    ("thresholds", (
+        "HIGH_COHERENCE", "MEDIUM_COHERENCE", "LOW_COHERENCE",
+        "MINIMUM_COHERENCE", "CoherenceLevel",
+    )),
+):
+    for _name in _names:
+        _SUBMODULE_BY_NAME[_name] = _submodule
+
+
+def __getattr__(name: str) -> Any:
+    # The eager imports used to bind the submodules themselves as
+    # package attributes; keep ra_constants.phi and friends working
+    if name in ("phi", "frequencies", "thresholds", "_classify"):
+        return import_module(f".{name}", __name__)
+    try:
+        submodule = _SUBMODULE_BY_NAME[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+    value = getattr(import_module(f".{submodule}", __name__), name)
+    # Cache on the package so later accesses bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
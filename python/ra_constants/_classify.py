@@ -0,0 +1,35 @@
+"""
+Shared edge-bisection helper for interval classifiers.
+
+(c) 2025 Anywave Creations
+MIT License
+"""
+
+from bisect import bisect_right
+from typing import Sequence, TypeVar
+
+T = TypeVar('T')
+
+
+def bisect_label(edges: Sequence[float], labels: Sequence[T], value: float) -> T:
+    """Map a value to a label by bisecting sorted interval edges.
+
+    ``edges[i]`` is the inclusive lower bound of the interval labelled
+    ``labels[i]``. Values below the first edge clamp to the first label
+    and values at or beyond the last interval clamp to the last label,
+    so ``edges`` may carry one trailing upper bound more than ``labels``.
+
+    Args:
+        edges: Sorted interval lower bounds
+        labels: Label for each interval, in edge order
+        value: Value to classify
+
+    Returns:
+        The label whose interval contains the value
+    """
+    i = bisect_right(edges, value) - 1
+    if i < 0:
+        return labels[0]
+    if i >= len(labels):
+        return labels[-1]
+    return labels[i]
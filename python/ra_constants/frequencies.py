@@ -7,23 +7,24 @@ Frequency constants - Schumann resonances, musical pitches, and material frequen
 MIT License
 """
 
+import math
 from enum import Enum
-from typing import NamedTuple
+from typing import Final, Iterable, NamedTuple
 
 # Schumann Resonances (Earth's electromagnetic resonant frequencies)
-SCHUMANN_FUNDAMENTAL: float = 7.83
+SCHUMANN_FUNDAMENTAL: Final[float] = 7.83
 """Schumann resonance fundamental frequency (Hz)"""
 
-SCHUMANN_2ND: float = 14.3
+SCHUMANN_2ND: Final[float] = 14.3
 """Second Schumann harmonic (Hz)"""
 
-SCHUMANN_3RD: float = 20.8
+SCHUMANN_3RD: Final[float] = 20.8
 """Third Schumann harmonic (Hz)"""
 
-SCHUMANN_4TH: float = 27.3
+SCHUMANN_4TH: Final[float] = 27.3
 """Fourth Schumann harmonic (Hz)"""
 
-SCHUMANN_5TH: float = 33.8
+SCHUMANN_5TH: Final[float] = 33.8
 """Fifth Schumann harmonic (Hz)"""
 
 SCHUMANN_HARMONICS: tuple[float, ...] = (
@@ -33,34 +34,38 @@ SCHUMANN_HARMONICS: tuple[float, ...] = (
     SCHUMANN_4TH,
     SCHUMANN_5TH,
 )
-"""All Schumann harmonics as a tuple"""
+"""All Schumann harmonics as an immutable tuple.
+
+Stable across the process lifetime, so numeric consumers can convert it
+to an array once at startup and reuse the result.
+"""
 
 
 # Musical Pitch Standards
-A432: float = 432.0
+A432: Final[float] = 432.0
 """Concert pitch A at 432 Hz (natural/Verdi tuning)"""
 
-A440: float = 440.0
+A440: Final[float] = 440.0
 """Concert pitch A at 440 Hz (ISO 16 standard)"""
 
 
 # Solfeggio Frequencies (ancient scale)
-SOLFEGGIO_UT: float = 396.0
+SOLFEGGIO_UT: Final[float] = 396.0
 """Ut (Do) - Liberation from fear and guilt"""
 
-SOLFEGGIO_RE: float = 417.0
+SOLFEGGIO_RE: Final[float] = 417.0
 """Re - Facilitating change, undoing situations"""
 
-SOLFEGGIO_MI: float = 528.0
+SOLFEGGIO_MI: Final[float] = 528.0
 """Mi - Transformation, miracles, DNA repair"""
 
-SOLFEGGIO_FA: float = 639.0
+SOLFEGGIO_FA: Final[float] = 639.0
 """Fa - Connecting relationships, harmony"""
 
-SOLFEGGIO_SOL: float = 741.0
+SOLFEGGIO_SOL: Final[float] = 741.0
 """Sol - Awakening intuition, expression"""
 
-SOLFEGGIO_LA: float = 852.0
+SOLFEGGIO_LA: Final[float] = 852.0
 """La - Returning to spiritual order"""
 
 SOLFEGGIO_FREQUENCIES: tuple[float, ...] = (
@@ -71,7 +76,11 @@ SOLFEGGIO_FREQUENCIES: tuple[float, ...] = (
     SOLFEGGIO_SOL,
     SOLFEGGIO_LA,
 )
-"""All Solfeggio frequencies as a tuple"""
+"""All Solfeggio frequencies as an immutable tuple.
+
+Stable across the process lifetime, so numeric consumers can convert it
+to an array once at startup and reuse the result.
+"""
 
 
 class MaterialProperties(NamedTuple):
@@ -95,26 +104,50 @@ class MaterialFrequency(Enum):
     GRANITE = MaterialProperties(4096.0, 0.5, 0.05)
     LIMESTONE = MaterialProperties(2048.0, 0.4, 0.02)
 
-    @property
-    def frequency(self) -> float:
-        """Get the base resonance frequency in Hz."""
-        return self.value.frequency
-
-    @property
-    def alpha_affinity(self) -> float:
-        """Get the alpha/coherence affinity (0-1)."""
-        return self.value.alpha_affinity
-
-    @property
-    def conductivity(self) -> float:
-        """Get the conductivity factor (0-1)."""
-        return self.value.conductivity
+    def __init__(self, frequency: float, alpha_affinity: float,
+                 conductivity: float) -> None:
+        # Enum unpacks the MaterialProperties fields as arguments;
+        # storing them as plain attributes makes each accessor a single
+        # attribute load instead of a property descriptor chain.
+        self.frequency = frequency
+        self.alpha_affinity = alpha_affinity
+        self.conductivity = conductivity
 
     @classmethod
     def from_name(cls, name: str) -> MaterialFrequency:
         """Get material by name (case-insensitive)."""
         return cls[name.upper()]
 
+    @classmethod
+    def frequencies(cls) -> tuple[float, ...]:
+        """All base frequencies (Hz) in member definition order."""
+        return _MATERIAL_FREQUENCIES
+
+    @classmethod
+    def affinities(cls) -> tuple[float, ...]:
+        """All alpha affinities in member definition order."""
+        return _MATERIAL_AFFINITIES
+
+    @classmethod
+    def conductivities(cls) -> tuple[float, ...]:
+        """All conductivity factors in member definition order."""
+        return _MATERIAL_CONDUCTIVITIES
+
+    @classmethod
+    def nearest_by_frequency(cls, hz: float) -> MaterialFrequency:
+        """Get the material whose base frequency is closest to hz."""
+        frequencies = _MATERIAL_FREQUENCIES
+        i = min(range(len(frequencies)), key=lambda j: abs(frequencies[j] - hz))
+        return _MATERIALS[i]
+
+
+# Structure-of-arrays views over the enum, in member definition order, so
+# bulk numeric queries avoid pulling whole NamedTuples through per member
+_MATERIALS: tuple[MaterialFrequency, ...] = tuple(MaterialFrequency)
+_MATERIAL_FREQUENCIES: tuple[float, ...] = tuple(m.value.frequency for m in _MATERIALS)
+_MATERIAL_AFFINITIES: tuple[float, ...] = tuple(m.value.alpha_affinity for m in _MATERIALS)
+_MATERIAL_CONDUCTIVITIES: tuple[float, ...] = tuple(m.value.conductivity for m in _MATERIALS)
+
 
 def octave_of(frequency: float, octaves: int = 1) -> float:
     """Calculate frequency shifted by octaves.
@@ -126,7 +159,8 @@ def octave_of(frequency: float, octaves: int = 1) -> float:
     Returns:
         Shifted frequency
     """
-    return frequency * (2 ** octaves)
+    # ldexp adjusts the IEEE exponent directly, skipping the pow routine
+    return math.ldexp(frequency, octaves)
 
 
 def harmonic_of(frequency: float, harmonic: int) -> float:
@@ -144,6 +178,35 @@ def harmonic_of(frequency: float, harmonic: int) -> float:
     return frequency * harmonic
 
 
+def harmonic_series(frequency: float, count: int) -> tuple[float, ...]:
+    """Generate the first n harmonics of a frequency in one pass.
+
+    Args:
+        frequency: Fundamental frequency in Hz
+        count: Number of harmonics to generate (1 = fundamental only)
+
+    Returns:
+        Tuple of harmonic frequencies from the fundamental upward
+    """
+    if count < 1:
+        raise ValueError("count must be >= 1")
+    return tuple(frequency * h for h in range(1, count + 1))
+
+
+def octave_series(frequency: float, octaves: Iterable[int]) -> tuple[float, ...]:
+    """Shift a frequency by each of several octave counts in one pass.
+
+    Args:
+        frequency: Base frequency in Hz
+        octaves: Octave shifts to apply (positive = up, negative = down)
+
+    Returns:
+        Tuple of shifted frequencies, one per requested octave
+    """
+    ldexp = math.ldexp
+    return tuple(ldexp(frequency, o) for o in octaves)
+
+
 def cents_difference(freq1: float, freq2: float) -> float:
     """Calculate the difference between two frequencies in cents.
 
@@ -154,5 +217,4 @@ def cents_difference(freq1: float, freq2: float) -> float:
     Returns:
         Difference in cents (100 cents = 1 semitone)
     """
-    import math
     return 1200 * math.log2(freq2 / freq1)
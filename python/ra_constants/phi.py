@@ -5,42 +5,48 @@ Mathematical constants - phi, roots, and transcendentals.
 MIT License
 """
 
-from typing import Dict, NamedTuple
+from __future__ import annotations
+
+import math
+from bisect import bisect_right
 from enum import Enum
+from functools import lru_cache
+from typing import Callable, Final, NamedTuple, Sequence
 
+from ._classify import bisect_label
 
 # =============================================================================
 # CORE CONSTANTS
 # =============================================================================
 
 # Golden Ratio and derivatives
-PHI: float = 1.618033988749895
+PHI: Final[float] = 1.618033988749895
 """The golden ratio (φ) = (1 + √5) / 2"""
 
-PHI_INVERSE: float = 0.6180339887498949
+PHI_INVERSE: Final[float] = 0.6180339887498949
 """Inverse of golden ratio (1/φ) = φ - 1"""
 
-PHI_SQUARED: float = 2.618033988749895
+PHI_SQUARED: Final[float] = 2.618033988749895
 """Phi squared (φ²) = φ + 1"""
 
 # Square roots
-SQRT_2: float = 1.4142135623730951
+SQRT_2: Final[float] = 1.4142135623730951
 """Square root of 2"""
 
-SQRT_3: float = 1.7320508075688772
+SQRT_3: Final[float] = 1.7320508075688772
 """Square root of 3"""
 
-SQRT_5: float = 2.23606797749979
+SQRT_5: Final[float] = 2.23606797749979
 """Square root of 5"""
 
 # Transcendental constants
-PI: float = 3.141592653589793
+PI: Final[float] = 3.141592653589793
 """Pi (π)"""
 
-TAU: float = 6.283185307179586
+TAU: Final[float] = 6.283185307179586
 """Tau (τ) = 2π"""
 
-E: float = 2.718281828459045
+E: Final[float] = 2.718281828459045
 """Euler's number (e)"""
 
 
@@ -48,8 +54,17 @@ E: float = 2.718281828459045
 # PHI POWER FUNCTION
 # =============================================================================
 
+_PHI_POW: dict[int, float] = {
+    k: (PHI ** k if k >= 0 else PHI_INVERSE ** (-k)) for k in range(-8, 9)
+}
+"""Precomputed φ^k for the small integer powers used throughout this module."""
+
+
 def phi_power(n: int) -> float:
-    """Calculate φ^n using the recurrence relation.
+    """Calculate φ^n using a precomputed lookup table.
+
+    Powers in the range -8..8 are resolved with a single dict lookup;
+    anything outside falls back to direct exponentiation.
 
     Args:
         n: The power (can be negative)
@@ -57,16 +72,9 @@ def phi_power(n: int) -> float:
     Returns:
         φ raised to the power n
     """
-    if n == 0:
-        return 1.0
-    elif n == 1:
-        return PHI
-    elif n == -1:
-        return PHI_INVERSE
-    elif n > 0:
-        return PHI ** n
-    else:
-        return PHI_INVERSE ** (-n)
+    if n in _PHI_POW:
+        return _PHI_POW[n]
+    return PHI ** n if n >= 0 else PHI_INVERSE ** (-n)
 
 
 # =============================================================================
@@ -87,50 +95,50 @@ class PhiBandInfo(NamedTuple):
 # Pre-computed band definitions
 PHI_BAND_ULTRA = PhiBandInfo(
     index=-2,
-    frequency=phi_power(-2),      # 0.382 Hz
-    period=1.0 / phi_power(-2),   # 2.618 sec
-    omega=TAU * phi_power(-2),    # 2.40 rad/sec
-    weight=phi_power(-2),         # 0.382
+    frequency=_PHI_POW[-2],      # 0.382 Hz
+    period=1.0 / _PHI_POW[-2],   # 2.618 sec
+    omega=TAU * _PHI_POW[-2],    # 2.40 rad/sec
+    weight=_PHI_POW[-2],         # 0.382
     name="ULTRA",
     description="Ultra-low: Ultradian rhythms, circadian influence"
 )
 
 PHI_BAND_SLOW = PhiBandInfo(
     index=-1,
-    frequency=phi_power(-1),      # 0.618 Hz
-    period=1.0 / phi_power(-1),   # 1.618 sec
-    omega=TAU * phi_power(-1),    # 3.88 rad/sec
-    weight=phi_power(-1),         # 0.618
+    frequency=_PHI_POW[-1],      # 0.618 Hz
+    period=1.0 / _PHI_POW[-1],   # 1.618 sec
+    omega=TAU * _PHI_POW[-1],    # 3.88 rad/sec
+    weight=_PHI_POW[-1],         # 0.618
     name="SLOW",
     description="Slow: Baroreflex, Mayer waves, blood pressure oscillations"
 )
 
 PHI_BAND_CORE = PhiBandInfo(
     index=0,
-    frequency=phi_power(0),       # 1.000 Hz
-    period=1.0 / phi_power(0),    # 1.000 sec
-    omega=TAU * phi_power(0),     # 6.28 rad/sec
-    weight=phi_power(0),          # 1.000
+    frequency=_PHI_POW[0],       # 1.000 Hz
+    period=1.0 / _PHI_POW[0],    # 1.000 sec
+    omega=TAU * _PHI_POW[0],     # 6.28 rad/sec
+    weight=_PHI_POW[0],          # 1.000
     name="CORE",
     description="Core: Reference baseline, ~60 bpm heart rate"
 )
 
 PHI_BAND_FAST = PhiBandInfo(
     index=1,
-    frequency=phi_power(1),       # 1.618 Hz
-    period=1.0 / phi_power(1),    # 0.618 sec
-    omega=TAU * phi_power(1),     # 10.16 rad/sec
-    weight=phi_power(-1),         # 0.618
+    frequency=_PHI_POW[1],       # 1.618 Hz
+    period=1.0 / _PHI_POW[1],    # 0.618 sec
+    omega=TAU * _PHI_POW[1],     # 10.16 rad/sec
+    weight=_PHI_POW[-1],         # 0.618
     name="FAST",
     description="Fast: Respiratory sinus arrhythmia, breath coupling"
 )
 
 PHI_BAND_RAPID = PhiBandInfo(
     index=2,
-    frequency=phi_power(2),       # 2.618 Hz
-    period=1.0 / phi_power(2),    # 0.382 sec
-    omega=TAU * phi_power(2),     # 16.44 rad/sec
-    weight=phi_power(-2),         # 0.382
+    frequency=_PHI_POW[2],       # 2.618 Hz
+    period=1.0 / _PHI_POW[2],    # 0.382 sec
+    omega=TAU * _PHI_POW[2],     # 16.44 rad/sec
+    weight=_PHI_POW[-2],         # 0.382
     name="RAPID",
     description="Rapid: Fast breathing, startle response, acute stress"
 )
@@ -144,110 +152,118 @@ class PhiBand(Enum):
     FAST = PHI_BAND_FAST
     RAPID = PHI_BAND_RAPID
 
-    @property
-    def index(self) -> int:
-        return self.value.index
-
-    @property
-    def frequency(self) -> float:
-        return self.value.frequency
-
-    @property
-    def period(self) -> float:
-        return self.value.period
-
-    @property
-    def omega(self) -> float:
-        return self.value.omega
-
-    @property
-    def weight(self) -> float:
-        return self.value.weight
-
-    @property
-    def description(self) -> str:
-        return self.value.description
+    def __init__(self, index: int, frequency: float, period: float,
+                 omega: float, weight: float, band_name: str,
+                 description: str) -> None:
+        # Enum unpacks the PhiBandInfo fields as arguments; storing them
+        # as plain attributes makes each accessor a single attribute
+        # load instead of a property plus NamedTuple field read. The
+        # band name is skipped since it duplicates the member name.
+        self.index = index
+        self.frequency = frequency
+        self.period = period
+        self.omega = omega
+        self.weight = weight
+        self.description = description
 
     @classmethod
-    def from_index(cls, k: int) -> 'PhiBand':
+    def from_index(cls, k: int) -> PhiBand:
         """Get band by index (-2 to +2)."""
-        for band in cls:
-            if band.index == k:
-                return band
-        raise ValueError(f"Invalid band index: {k}. Must be -2 to +2.")
+        try:
+            return _BAND_BY_INDEX[k]
+        except KeyError:
+            raise ValueError(f"Invalid band index: {k}. Must be -2 to +2.") from None
 
     @classmethod
-    def all_bands(cls) -> list:
+    def all_bands(cls) -> tuple[PhiBand, ...]:
         """Return all bands in order from ULTRA to RAPID."""
-        return [cls.ULTRA, cls.SLOW, cls.CORE, cls.FAST, cls.RAPID]
+        return _ALL_BANDS
+
+
+# Member lookups built once after the class exists, so from_index is a
+# single dict probe and all_bands never allocates
+_ALL_BANDS: tuple[PhiBand, ...] = (PhiBand.ULTRA, PhiBand.SLOW, PhiBand.CORE,
+                     PhiBand.FAST, PhiBand.RAPID)
+_BAND_BY_INDEX: dict[int, PhiBand] = {band.value.index: band for band in PhiBand}
 
 
 # Convenience dictionaries for direct access
-PHI_BANDS: Dict[str, float] = {
-    'ULTRA': phi_power(-2),   # 0.382
-    'SLOW':  phi_power(-1),   # 0.618
-    'CORE':  phi_power(0),    # 1.000
-    'FAST':  phi_power(1),    # 1.618
-    'RAPID': phi_power(2),    # 2.618
+PHI_BANDS: dict[str, float] = {
+    'ULTRA': _PHI_POW[-2],   # 0.382
+    'SLOW':  _PHI_POW[-1],   # 0.618
+    'CORE':  _PHI_POW[0],    # 1.000
+    'FAST':  _PHI_POW[1],    # 1.618
+    'RAPID': _PHI_POW[2],    # 2.618
 }
 """φ-scaled frequencies (Hz) for the five coherence bands."""
 
-PHI_PERIODS: Dict[str, float] = {
-    'ULTRA': 1.0 / phi_power(-2),   # 2.618 sec
-    'SLOW':  1.0 / phi_power(-1),   # 1.618 sec
-    'CORE':  1.0 / phi_power(0),    # 1.000 sec
-    'FAST':  1.0 / phi_power(1),    # 0.618 sec
-    'RAPID': 1.0 / phi_power(2),    # 0.382 sec
+PHI_PERIODS: dict[str, float] = {
+    'ULTRA': 1.0 / _PHI_POW[-2],   # 2.618 sec
+    'SLOW':  1.0 / _PHI_POW[-1],   # 1.618 sec
+    'CORE':  1.0 / _PHI_POW[0],    # 1.000 sec
+    'FAST':  1.0 / _PHI_POW[1],    # 0.618 sec
+    'RAPID': 1.0 / _PHI_POW[2],    # 0.382 sec
 }
 """Period equivalents (seconds) for the five coherence bands."""
 
-PHI_OMEGA: Dict[str, float] = {
-    'ULTRA': TAU * phi_power(-2),   # 2.40 rad/sec
-    'SLOW':  TAU * phi_power(-1),   # 3.88 rad/sec
-    'CORE':  TAU * phi_power(0),    # 6.28 rad/sec
-    'FAST':  TAU * phi_power(1),    # 10.16 rad/sec
-    'RAPID': TAU * phi_power(2),    # 16.44 rad/sec
+PHI_OMEGA: dict[str, float] = {
+    'ULTRA': TAU * _PHI_POW[-2],   # 2.40 rad/sec
+    'SLOW':  TAU * _PHI_POW[-1],   # 3.88 rad/sec
+    'CORE':  TAU * _PHI_POW[0],    # 6.28 rad/sec
+    'FAST':  TAU * _PHI_POW[1],    # 10.16 rad/sec
+    'RAPID': TAU * _PHI_POW[2],    # 16.44 rad/sec
 }
 """Angular frequencies (rad/sec) for the five coherence bands."""
 
-PHI_WEIGHTS: Dict[str, float] = {
-    'ULTRA': phi_power(-2),   # 0.382
-    'SLOW':  phi_power(-1),   # 0.618
-    'CORE':  phi_power(0),    # 1.000
-    'FAST':  phi_power(-1),   # 0.618 (symmetric)
-    'RAPID': phi_power(-2),   # 0.382 (symmetric)
+PHI_WEIGHTS: dict[str, float] = {
+    'ULTRA': _PHI_POW[-2],   # 0.382
+    'SLOW':  _PHI_POW[-1],   # 0.618
+    'CORE':  _PHI_POW[0],    # 1.000
+    'FAST':  _PHI_POW[-1],   # 0.618 (symmetric)
+    'RAPID': _PHI_POW[-2],   # 0.382 (symmetric)
 }
 """Amplitude weights for band contributions (symmetric around CORE)."""
 
+# Parallel structure-of-arrays views of the four dicts above, in fixed
+# ULTRA..RAPID order. Hot loops index these positionally instead of
+# hashing band-name keys; string-keyed callers can translate through
+# _BAND_NAME_TO_IDX.
+_BAND_NAMES: tuple[str, ...] = ('ULTRA', 'SLOW', 'CORE', 'FAST', 'RAPID')
+_BAND_NAME_TO_IDX: dict[str, int] = {name: i for i, name in enumerate(_BAND_NAMES)}
+_BAND_FREQ_VALUES: tuple[float, ...] = tuple(PHI_BANDS[name] for name in _BAND_NAMES)
+_BAND_PERIOD_VALUES: tuple[float, ...] = tuple(PHI_PERIODS[name] for name in _BAND_NAMES)
+_BAND_OMEGA_VALUES: tuple[float, ...] = tuple(PHI_OMEGA[name] for name in _BAND_NAMES)
+_BAND_WEIGHT_VALUES: tuple[float, ...] = tuple(PHI_WEIGHTS[name] for name in _BAND_NAMES)
+
 
 # =============================================================================
 # RA SYSTEM NAMED CONSTANTS
 # =============================================================================
 
 # Named powers for the Ra System
-GREEN_PHI: float = PHI
+GREEN_PHI: Final[float] = PHI
 """φ¹ ≈ 1.618 - Base golden ratio (consent threshold: FULL)"""
 
-ANKH: float = phi_power(3)
+ANKH: Final[float] = _PHI_POW[3]
 """φ³ ≈ 4.236 - Cubic extension"""
 
-RA: float = phi_power(5)
+RA: Final[float] = _PHI_POW[5]
 """φ⁵ ≈ 11.090 - Fifth power"""
 
-SCARAB: float = phi_power(7)
+SCARAB: Final[float] = _PHI_POW[7]
 """φ⁷ ≈ 29.034 - Seventh power"""
 
 # Inverse powers for threshold cascade
-PHI_NEG1: float = phi_power(-1)
+PHI_NEG1: Final[float] = _PHI_POW[-1]
 """φ⁻¹ ≈ 0.618 - DIMINISHED_CONSENT threshold"""
 
-PHI_NEG2: float = phi_power(-2)
+PHI_NEG2: Final[float] = _PHI_POW[-2]
 """φ⁻² ≈ 0.382 - SUSPENDED_CONSENT threshold"""
 
-PHI_NEG3: float = phi_power(-3)
+PHI_NEG3: Final[float] = _PHI_POW[-3]
 """φ⁻³ ≈ 0.236 - EMERGENCY_OVERRIDE threshold"""
 
-PHI_NEG4: float = phi_power(-4)
+PHI_NEG4: Final[float] = _PHI_POW[-4]
 """φ⁻⁴ ≈ 0.146 - Critical minimum"""
 
 
@@ -255,9 +271,13 @@ PHI_NEG4: float = phi_power(-4)
 # UTILITY FUNCTIONS
 # =============================================================================
 
+@lru_cache(maxsize=128)
 def fibonacci_ratio(n: int) -> float:
     """Calculate the ratio F(n+1)/F(n) which approaches φ.
 
+    Uses Binet's formula, F(n) = (φ^n - ψ^n) / √5 with ψ = -1/φ, so the
+    ratio is computed in O(1) instead of iterating the sequence.
+
     Args:
         n: The Fibonacci index (must be >= 1)
 
@@ -267,11 +287,14 @@ def fibonacci_ratio(n: int) -> float:
     if n < 1:
         raise ValueError("n must be >= 1")
 
-    fib_prev, fib_curr = 1, 1
-    for _ in range(n - 1):
-        fib_prev, fib_curr = fib_curr, fib_prev + fib_curr
+    # Beyond ~70 the ψ^n correction is far below float precision
+    if n > 70:
+        return PHI
 
-    return fib_curr / fib_prev
+    psi = -PHI_INVERSE
+    numerator = PHI ** (n + 1) - psi ** (n + 1)
+    denominator = PHI ** n - psi ** n
+    return numerator / denominator
 
 
 def is_phi_ratio(a: float, b: float, tolerance: float = 0.01) -> bool:
@@ -285,72 +308,133 @@ def is_phi_ratio(a: float, b: float, tolerance: float = 0.01) -> bool:
     Returns:
         True if b/a is approximately φ
     """
-    if a <= 0 or b <= 0:
+    if a <= 0.0 or b <= 0.0:
         return False
 
-    ratio = max(a, b) / min(a, b)
-    return abs(ratio - PHI) < tolerance
+    hi = a if a > b else b
+    lo = b if a > b else a
+    return abs(hi / lo - PHI) < tolerance
 
 
-def band_frequency_range(band: PhiBand) -> tuple:
+# Ranges are fixed for the five members, so compute them once at import
+_SQRT_PHI: float = PHI ** 0.5
+_BAND_RANGE: dict[PhiBand, tuple[float, float]] = {
+    band: (_PHI_POW[band.index] / _SQRT_PHI, _PHI_POW[band.index] * _SQRT_PHI)
+    for band in PhiBand
+}
+
+
+def band_frequency_range(band: PhiBand) -> tuple[float, float]:
     """Get the frequency range for a φ band.
-    
+
     Uses geometric mean boundaries: (φ^(k-0.5), φ^(k+0.5))
-    
+
     Args:
         band: The PhiBand to get range for
-        
+
     Returns:
         (lower_hz, upper_hz) tuple
     """
-    k = band.index
-    lower = phi_power(k) / (PHI ** 0.5)  # φ^(k-0.5)
-    upper = phi_power(k) * (PHI ** 0.5)  # φ^(k+0.5)
-    return (lower, upper)
+    return _BAND_RANGE[band]
+
+
+# Sorted geometric-mean band edges (φ^(k+0.5) for k in -3..2), precomputed
+# so classification is a single bisection into _ALL_BANDS.
+_BAND_EDGES: tuple[float, ...] = tuple(PHI ** (k + 0.5) for k in range(-3, 3))
 
 
 def frequency_to_band(freq_hz: float) -> PhiBand:
     """Classify a frequency into its φ band.
-    
+
+    Frequencies below the ULTRA band clamp to ULTRA; frequencies above
+    the RAPID band clamp to RAPID.
+
     Args:
         freq_hz: Frequency in Hz
-        
+
     Returns:
         The PhiBand containing this frequency
     """
-    for band in PhiBand.all_bands():
-        lower, upper = band_frequency_range(band)
-        if lower <= freq_hz < upper:
-            return band
-    
-    # Edge cases
-    if freq_hz < band_frequency_range(PhiBand.ULTRA)[0]:
-        return PhiBand.ULTRA
-    return PhiBand.RAPID
-
-
-def compute_multiwave_coherence(amplitudes: Dict[str, float],
-                                phases: Dict[str, float],
-                                reference_phase: float = 0.0) -> float:
+    return bisect_label(_BAND_EDGES, _ALL_BANDS, freq_hz)
+
+
+def frequency_to_band_batch(freqs: Sequence[float]) -> list[int]:
+    """Classify a sequence of frequencies into φ band indices.
+
+    Args:
+        freqs: Frequencies in Hz
+
+    Returns:
+        The band index k (as in φ^k, -2 to +2) for each frequency
+    """
+    edges = _BAND_EDGES
+    return [max(-2, min(2, bisect_right(edges, f) - 3)) for f in freqs]
+
+
+# Bound at module scope so the hot loop avoids a per-call attribute load
+_cos: Callable[[float], float] = math.cos
+
+
+def compute_multiwave_coherence(amplitudes: dict[str, float],
+                                phases: dict[str, float],
+                                reference_phase: float = 0.0,
+                                *,
+                                _bands: tuple[str, ...] = _BAND_NAMES,
+                                _weights: tuple[float, ...] = _BAND_WEIGHT_VALUES,
+                                _cos: Callable[[float], float] = _cos) -> float:
     """Compute weighted coherence from band amplitudes and phases.
-    
+
     Formula: C = Σ_k w_k × A_k × cos(ψ_k - ψ_ref)
-    
+
+    The underscore-prefixed parameters bind hot globals as argument
+    defaults and are not part of the public signature.
+
     Args:
         amplitudes: Dict mapping band name to amplitude
         phases: Dict mapping band name to phase (radians)
         reference_phase: Reference phase for alignment (default 0)
-        
+
     Returns:
         Scalar coherence value
     """
-    import math
-    
     total = 0.0
-    for band_name, weight in PHI_WEIGHTS.items():
-        if band_name in amplitudes and band_name in phases:
-            A = amplitudes[band_name]
-            psi = phases[band_name]
-            total += weight * A * math.cos(psi - reference_phase)
-    
+    for band_name, weight in zip(_bands, _weights):
+        A = amplitudes.get(band_name)
+        psi = phases.get(band_name)
+        if A is not None and psi is not None:
+            total += weight * A * _cos(psi - reference_phase)
+
     return max(0.0, min(1.0, total))
+
+
+def compute_multiwave_coherence_batch(amplitudes: Sequence[Sequence[float]],
+                                      phases: Sequence[Sequence[float]],
+                                      reference_phase: float = 0.0) -> list[float]:
+    """Compute weighted coherence for a batch of samples in one pass.
+
+    Each sample is a 5-element row of per-band values ordered as
+    ('ULTRA', 'SLOW', 'CORE', 'FAST', 'RAPID'), avoiding the per-sample
+    dict construction and lookups of the scalar entry point.
+
+    Args:
+        amplitudes: Sequence of 5-element amplitude rows
+        phases: Sequence of 5-element phase rows (radians)
+        reference_phase: Reference phase for alignment (default 0)
+
+    Returns:
+        One clamped coherence value per sample
+    """
+    if len(amplitudes) != len(phases):
+        raise ValueError("amplitudes and phases must have the same length")
+
+    weights = _BAND_WEIGHT_VALUES
+    cos = _cos
+    results = []
+    for amps, psis in zip(amplitudes, phases):
+        if len(amps) != 5 or len(psis) != 5:
+            raise ValueError("Each sample must have exactly 5 band values")
+        total = 0.0
+        for weight, amp, psi in zip(weights, amps, psis):
+            total += weight * amp * cos(psi - reference_phase)
+        results.append(max(0.0, min(1.0, total)))
+    return results
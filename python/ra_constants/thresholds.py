@@ -7,20 +7,24 @@ Coherence thresholds - Generic bands for coherence state classification.
 MIT License
 """
 
+import math
+from bisect import bisect_right
 from enum import Enum
-from typing import NamedTuple
+from typing import Final, NamedTuple, Sequence
+
+from ._classify import bisect_label
 
 # Generic coherence thresholds (not application-specific)
-HIGH_COHERENCE: float = 0.85
+HIGH_COHERENCE: Final[float] = 0.85
 """High coherence threshold (85%)"""
 
-MEDIUM_COHERENCE: float = 0.6
+MEDIUM_COHERENCE: Final[float] = 0.6
 """Medium coherence threshold (60%)"""
 
-LOW_COHERENCE: float = 0.3
+LOW_COHERENCE: Final[float] = 0.3
 """Low coherence threshold (30%)"""
 
-MINIMUM_COHERENCE: float = 0.1
+MINIMUM_COHERENCE: Final[float] = 0.1
 """Minimum detectable coherence (10%)"""
 
 
@@ -36,21 +40,24 @@ class CoherenceLevel(Enum):
 
     Generic bands for categorizing coherence values.
     """
+    # Declared (not assigned) so EnumMeta ignores them as members while
+    # type checkers see the per-member attributes set in __init__
+    lower: float
+    upper: float
+
     PEAK = CoherenceBand(HIGH_COHERENCE, 1.01, "peak")
     HIGH = CoherenceBand(MEDIUM_COHERENCE, HIGH_COHERENCE, "high")
     MEDIUM = CoherenceBand(LOW_COHERENCE, MEDIUM_COHERENCE, "medium")
     LOW = CoherenceBand(MINIMUM_COHERENCE, LOW_COHERENCE, "low")
     MINIMAL = CoherenceBand(0.0, MINIMUM_COHERENCE, "minimal")
 
-    @property
-    def lower(self) -> float:
-        """Get lower bound of this band."""
-        return self.value.lower
-
-    @property
-    def upper(self) -> float:
-        """Get upper bound of this band."""
-        return self.value.upper
+    def __init__(self, lower: float, upper: float, band_name: str) -> None:
+        # Enum unpacks the CoherenceBand fields as arguments; storing the
+        # bounds as plain attributes avoids the property descriptor and
+        # NamedTuple indirection on every comparison. The band name is
+        # skipped since it duplicates the member name.
+        self.lower = lower
+        self.upper = upper
 
     @classmethod
     def classify(cls, value: float) -> CoherenceLevel:
@@ -65,12 +72,26 @@ class CoherenceLevel(Enum):
         if value < 0 or value > 1:
             raise ValueError("Coherence must be between 0 and 1")
 
-        for level in cls:
-            if level.value.lower <= value < level.value.upper:
-                return level
+        return bisect_label(_COHERENCE_EDGES, _LEVELS_BY_IDX, value)
+
+    @classmethod
+    def classify_batch(cls, values: Sequence[float]) -> list[CoherenceLevel]:
+        """Classify a sequence of coherence values in one pass.
 
-        # Handle edge case of exactly 1.0
-        return cls.PEAK
+        Args:
+            values: Coherence values (each 0-1)
+
+        Returns:
+            The CoherenceLevel for each value
+        """
+        edges = _COHERENCE_EDGES
+        levels = _LEVELS_BY_IDX
+        results: list[CoherenceLevel] = []
+        for value in values:
+            if value < 0 or value > 1:
+                raise ValueError("Coherence must be between 0 and 1")
+            results.append(levels[bisect_right(edges, value) - 1])
+        return results
 
     def contains(self, value: float) -> bool:
         """Check if a value falls within this band.
@@ -81,7 +102,29 @@ class CoherenceLevel(Enum):
         Returns:
             True if value is in this band
         """
-        return self.value.lower <= value < self.value.upper
+        return self.lower <= value < self.upper
+
+    def contains_batch(self, values: Sequence[float]) -> list[bool]:
+        """Check which of a sequence of values fall within this band.
+
+        Args:
+            values: Coherence values to check
+
+        Returns:
+            One bool per value
+        """
+        lo = self.lower
+        hi = self.upper
+        return [lo <= v < hi for v in values]
+
+
+# Sorted classification edges and the level each interval maps to, built
+# once so classify is a single bisection instead of a member scan
+_COHERENCE_EDGES: tuple[float, ...] = (0.0, MINIMUM_COHERENCE, LOW_COHERENCE,
+                           MEDIUM_COHERENCE, HIGH_COHERENCE)
+_LEVELS_BY_IDX: tuple[CoherenceLevel, ...] = (CoherenceLevel.MINIMAL, CoherenceLevel.LOW,
+                         CoherenceLevel.MEDIUM, CoherenceLevel.HIGH,
+                         CoherenceLevel.PEAK)
 
 
 def normalize_coherence(value: float, min_val: float = 0.0, max_val: float = 1.0) -> float:
@@ -115,21 +158,30 @@ def coherence_delta(current: float, previous: float) -> float:
     return current - previous
 
 
-def is_coherence_stable(values: list[float], threshold: float = 0.05) -> bool:
+def is_coherence_stable(values: Sequence[float], threshold: float = 0.05) -> bool:
     """Check if a series of coherence values is stable.
 
     Args:
-        values: List of coherence measurements
+        values: Sequence of coherence measurements
         threshold: Maximum allowed standard deviation
 
     Returns:
         True if coherence is stable
     """
-    if len(values) < 2:
+    n = len(values)
+    if n < 2:
         return True
 
-    mean = sum(values) / len(values)
-    variance = sum((v - mean) ** 2 for v in values) / len(values)
-    std_dev = variance ** 0.5
+    # Single pass: accumulate the sum and sum of squares together
+    total = 0.0
+    total_sq = 0.0
+    for v in values:
+        total += v
+        total_sq += v * v
+
+    mean = total / n
+    variance = total_sq / n - mean * mean
+    if variance < 0.0:  # guard against rounding pushing variance negative
+        variance = 0.0
 
-    return std_dev <= threshold
+    return math.sqrt(variance) <= threshold
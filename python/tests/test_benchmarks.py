@@ -0,0 +1,28 @@
+"""Microbenchmark guardrails for hot classification paths.
+
+Requires pytest-benchmark (skipped entirely when absent). Run with:
+pytest tests/test_benchmarks.py --benchmark-only
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from ra_constants import CoherenceLevel, frequency_to_band
+
+
+@pytest.fixture(autouse=True)
+def _benchmark_only(request):
+    """Keep benchmarks out of plain pytest runs; opt in via --benchmark-only."""
+    if not request.config.getoption("--benchmark-only"):
+        pytest.skip("benchmarks run only with --benchmark-only")
+
+
+def test_classify_bench(benchmark):
+    """Guards against regressions in CoherenceLevel attribute access."""
+    assert benchmark(CoherenceLevel.classify, 0.7) is CoherenceLevel.HIGH
+
+
+def test_frequency_to_band_bench(benchmark):
+    """Guards the bisection-based band classifier."""
+    benchmark(frequency_to_band, 1.0)
@@ -10,7 +10,13 @@ from ra_constants import (
     SOLFEGGIO_MI,
     MaterialFrequency,
 )
-from ra_constants.frequencies import cents_difference, harmonic_of, octave_of
+from ra_constants.frequencies import (
+    cents_difference,
+    harmonic_of,
+    harmonic_series,
+    octave_of,
+    octave_series,
+)
 
 
 class TestSchumannFrequencies:
@@ -52,6 +58,15 @@ class TestMaterialFrequency:
         assert MaterialFrequency.from_name("gold") == MaterialFrequency.GOLD
         assert MaterialFrequency.from_name("QUARTZ") == MaterialFrequency.QUARTZ
 
+    def test_frequencies_order(self):
+        frequencies = MaterialFrequency.frequencies()
+        assert len(frequencies) == len(MaterialFrequency)
+        assert frequencies[0] == MaterialFrequency.QUARTZ.frequency
+
+    def test_nearest_by_frequency(self):
+        assert MaterialFrequency.nearest_by_frequency(32000.0) == MaterialFrequency.QUARTZ
+        assert MaterialFrequency.nearest_by_frequency(2000.0) == MaterialFrequency.LIMESTONE
+
 
 class TestOctaveOf:
     def test_octave_up(self):
@@ -79,6 +94,20 @@ class TestHarmonicOf:
             harmonic_of(100.0, 0)
 
 
+class TestHarmonicSeries:
+    def test_first_three_harmonics(self):
+        assert harmonic_series(100.0, 3) == (100.0, 200.0, 300.0)
+
+    def test_invalid_count(self):
+        with pytest.raises(ValueError):
+            harmonic_series(100.0, 0)
+
+
+class TestOctaveSeries:
+    def test_octave_stack(self):
+        assert octave_series(440.0, [-1, 0, 1]) == (220.0, 440.0, 880.0)
+
+
 class TestCentsDifference:
     def test_octave_is_1200_cents(self):
         assert abs(cents_difference(440.0, 880.0) - 1200.0) < 1e-10
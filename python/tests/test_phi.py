@@ -3,7 +3,16 @@
 import pytest
 
 from ra_constants import PHI, PHI_INVERSE, PHI_SQUARED
-from ra_constants.phi import fibonacci_ratio, is_phi_ratio, phi_power
+from ra_constants.phi import (
+    PhiBand,
+    compute_multiwave_coherence,
+    compute_multiwave_coherence_batch,
+    fibonacci_ratio,
+    frequency_to_band,
+    frequency_to_band_batch,
+    is_phi_ratio,
+    phi_power,
+)
 
 
 class TestPhiConstants:
@@ -61,3 +70,41 @@ class TestIsPhiRatio:
     def test_phi_ratio_negative_values(self):
         assert not is_phi_ratio(-1.0, 1.0)
         assert not is_phi_ratio(1.0, -1.0)
+
+
+class TestFrequencyToBand:
+    def test_core_band(self):
+        assert frequency_to_band(1.0) == PhiBand.CORE
+
+    def test_clamps_below_ultra(self):
+        assert frequency_to_band(0.01) == PhiBand.ULTRA
+
+    def test_clamps_above_rapid(self):
+        assert frequency_to_band(100.0) == PhiBand.RAPID
+
+    def test_batch_indices(self):
+        freqs = [0.01, 0.618, 1.0, 1.618, 100.0]
+        assert frequency_to_band_batch(freqs) == [-2, -1, 0, 1, 2]
+
+
+class TestComputeMultiwaveCoherenceBatch:
+    BAND_ORDER = ("ULTRA", "SLOW", "CORE", "FAST", "RAPID")
+
+    def test_matches_scalar(self):
+        amplitudes = {"ULTRA": 0.2, "SLOW": 0.4, "CORE": 0.9, "FAST": 0.4, "RAPID": 0.2}
+        phases = {"ULTRA": 0.1, "SLOW": 0.0, "CORE": 0.05, "FAST": -0.1, "RAPID": 0.2}
+        amp_row = [amplitudes[name] for name in self.BAND_ORDER]
+        phase_row = [phases[name] for name in self.BAND_ORDER]
+
+        expected = compute_multiwave_coherence(amplitudes, phases)
+        result = compute_multiwave_coherence_batch([amp_row], [phase_row])
+
+        assert result == [pytest.approx(expected)]
+
+    def test_length_mismatch(self):
+        with pytest.raises(ValueError):
+            compute_multiwave_coherence_batch([[0.0] * 5], [])
+
+    def test_bad_row_width(self):
+        with pytest.raises(ValueError):
+            compute_multiwave_coherence_batch([[0.0] * 4], [[0.0] * 5])
@@ -1,6 +1,12 @@
-"""Tests for thresholds module."""
+"""Tests for thresholds module.
+
+All tests here are pure (no shared state or I/O), so the module is safe
+to parallelize across workers: pytest -n auto
+"""
 
 import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
 
 from ra_constants import (
     HIGH_COHERENCE,
@@ -15,65 +21,92 @@ from ra_constants.thresholds import (
     normalize_coherence,
 )
 
+# Enum attribute access goes through EnumMeta's descriptor machinery;
+# bind the members once so assertions do a plain global load
+PEAK, HIGH, MEDIUM, LOW, MINIMAL = (
+    CoherenceLevel.PEAK,
+    CoherenceLevel.HIGH,
+    CoherenceLevel.MEDIUM,
+    CoherenceLevel.LOW,
+    CoherenceLevel.MINIMAL,
+)
 
-class TestCoherenceConstants:
-    def test_high_coherence(self):
-        assert HIGH_COHERENCE == 0.85
-
-    def test_medium_coherence(self):
-        assert MEDIUM_COHERENCE == 0.6
-
-    def test_low_coherence(self):
-        assert LOW_COHERENCE == 0.3
 
-    def test_minimum_coherence(self):
-        assert MINIMUM_COHERENCE == 0.1
+class TestCoherenceConstants:
+    @pytest.mark.parametrize(
+        "actual,expected",
+        [
+            (HIGH_COHERENCE, 0.85),
+            (MEDIUM_COHERENCE, 0.6),
+            (LOW_COHERENCE, 0.3),
+            (MINIMUM_COHERENCE, 0.1),
+        ],
+    )
+    def test_constant_value(self, actual, expected):
+        assert actual == expected
 
 
 class TestCoherenceLevel:
-    def test_classify_peak(self):
-        assert CoherenceLevel.classify(0.9) == CoherenceLevel.PEAK
-
-    def test_classify_high(self):
-        assert CoherenceLevel.classify(0.7) == CoherenceLevel.HIGH
-
-    def test_classify_medium(self):
-        assert CoherenceLevel.classify(0.4) == CoherenceLevel.MEDIUM
-
-    def test_classify_low(self):
-        assert CoherenceLevel.classify(0.2) == CoherenceLevel.LOW
-
-    def test_classify_minimal(self):
-        assert CoherenceLevel.classify(0.05) == CoherenceLevel.MINIMAL
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            (0.9, PEAK),
+            (0.7, HIGH),
+            (0.4, MEDIUM),
+            (0.2, LOW),
+            (0.05, MINIMAL),
+            (0.85, PEAK),  # boundary
+            (1.0, PEAK),   # exactly one
+        ],
+    )
+    def test_classify(self, value, expected):
+        assert CoherenceLevel.classify(value) is expected
+
+    @pytest.mark.parametrize("value", [-0.1, 1.1])
+    def test_classify_invalid(self, value):
+        with pytest.raises(ValueError):
+            CoherenceLevel.classify(value)
 
-    def test_classify_boundary_high(self):
-        assert CoherenceLevel.classify(0.85) == CoherenceLevel.PEAK
+    def test_contains(self):
+        assert PEAK.contains(0.9)
+        assert not PEAK.contains(0.5)
 
-    def test_classify_exactly_one(self):
-        assert CoherenceLevel.classify(1.0) == CoherenceLevel.PEAK
+    def test_contains_batch(self):
+        assert PEAK.contains_batch([0.9, 0.5, 1.0]) == [True, False, True]
 
-    def test_classify_invalid_negative(self):
-        with pytest.raises(ValueError):
-            CoherenceLevel.classify(-0.1)
+    def test_classify_batch(self):
+        assert CoherenceLevel.classify_batch([0.9, 0.4, 0.05]) == [
+            PEAK,
+            MEDIUM,
+            MINIMAL,
+        ]
 
-    def test_classify_invalid_over_one(self):
+    def test_classify_batch_invalid(self):
         with pytest.raises(ValueError):
-            CoherenceLevel.classify(1.1)
-
-    def test_contains(self):
-        assert CoherenceLevel.PEAK.contains(0.9)
-        assert not CoherenceLevel.PEAK.contains(0.5)
+            CoherenceLevel.classify_batch([0.5, 1.1])
 
 
 class TestNormalizeCoherence:
-    def test_normalize_middle(self):
-        assert abs(normalize_coherence(50.0, 0.0, 100.0) - 0.5) < 1e-10
-
-    def test_normalize_clamp_low(self):
-        assert normalize_coherence(-10.0, 0.0, 100.0) == 0.0
-
-    def test_normalize_clamp_high(self):
-        assert normalize_coherence(150.0, 0.0, 100.0) == 1.0
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            (50.0, 0.5),   # middle of range
+            (-10.0, 0.0),  # clamps low
+            (150.0, 1.0),  # clamps high
+        ],
+    )
+    def test_normalize(self, value, expected):
+        assert normalize_coherence(value, 0.0, 100.0) == pytest.approx(expected, abs=1e-10)
+
+    @given(
+        value=st.floats(-1e6, 1e6),
+        min_val=st.floats(-100.0, 0.0),
+        max_val=st.floats(1.0, 100.0),
+    )
+    @settings(max_examples=50, deadline=None)
+    def test_normalize_stays_in_range(self, value, min_val, max_val):
+        """The result is clamped to 0-1 for any valid input range."""
+        assert 0.0 <= normalize_coherence(value, min_val, max_val) <= 1.0
 
     def test_normalize_invalid_range(self):
         with pytest.raises(ValueError):
@@ -88,15 +121,19 @@ class TestCoherenceDelta:
         assert coherence_delta(0.5, 0.8) == pytest.approx(-0.3)
 
 
+# Built once at import; tuples of constants are folded into co_consts,
+# so referencing them directly beats per-test fixture resolution
+_STABLE_SERIES = (0.5, 0.51, 0.49, 0.5)
+_UNSTABLE_SERIES = (0.1, 0.9, 0.1, 0.9)
+
+
 class TestIsCoherenceStable:
     def test_stable_values(self):
-        assert is_coherence_stable([0.5, 0.51, 0.49, 0.5])
+        assert is_coherence_stable(_STABLE_SERIES)
 
     def test_unstable_values(self):
-        assert not is_coherence_stable([0.1, 0.9, 0.1, 0.9])
-
-    def test_single_value(self):
-        assert is_coherence_stable([0.5])
+        assert not is_coherence_stable(_UNSTABLE_SERIES)
 
-    def test_empty_list(self):
-        assert is_coherence_stable([])
+    @pytest.mark.parametrize("values", [(), (0.5,)])
+    def test_degenerate_series_is_stable(self, values):
+        assert is_coherence_stable(values)